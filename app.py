@@ -1,35 +1,83 @@
 import argparse
+import os
+import queue
+import select
 import sys
+import threading
 from typing import Optional, Callable
 
 from client import LinuxCommandClient
 
 
-def get_connection_code() -> str:
-    return input("Enter connection code: ").strip()
+STDIN_POLL_INTERVAL = 0.5
 
 
-def prompt_for_connection_code() -> str:
+def read_line(stop: Optional[threading.Event] = None) -> str:
+    fd = sys.stdin.fileno()
+    line = bytearray()
     while True:
-        connection_code = get_connection_code()
+        if stop is not None and stop.is_set():
+            raise EOFError("Connection code prompt cancelled")
+        ready, _, _ = select.select([fd], [], [], STDIN_POLL_INTERVAL)
+        if not ready:
+            continue
+        char = os.read(fd, 1)
+        if not char:
+            raise EOFError("EOF when reading a line")
+        if char == b"\n":
+            return line.decode(errors="replace")
+        line += char
+
+
+def get_connection_code(stop: Optional[threading.Event] = None) -> str:
+    print("Enter connection code: ", end="", flush=True)
+    return read_line(stop).strip()
+
+
+def prompt_for_connection_code(stop: Optional[threading.Event] = None) -> str:
+    while True:
+        connection_code = get_connection_code(stop)
         if connection_code:
             return connection_code
         print("Connection code is required.")
 
 
-def create_connection_code_callback() -> Callable[[], str]:
-    def get_new_connection_code() -> str:
+def create_connection_code_callback(stop: threading.Event) -> Callable[[], Optional[str]]:
+    connection_codes = queue.Queue()
+    prompt_thread = None
+    
+    def read_connection_code() -> None:
         print("Connection failed! Please enter a new connection code.\n")
-        return prompt_for_connection_code()
+        try:
+            connection_codes.put(prompt_for_connection_code(stop))
+        except Exception as e:
+            connection_codes.put(e)
+    
+    def get_new_connection_code() -> Optional[str]:
+        nonlocal prompt_thread
+        prompting = prompt_thread is not None and prompt_thread.is_alive()
+        
+        try:
+            connection_code = connection_codes.get_nowait()
+        except queue.Empty:
+            if not prompting:
+                prompt_thread = threading.Thread(target=read_connection_code, daemon=True)
+                prompt_thread.start()
+            return None
+        
+        if isinstance(connection_code, Exception):
+            raise connection_code
+        return connection_code
     return get_new_connection_code
 
 
 def main() -> None:    
     connection_code = None
     connection_code_callback = None
+    stop_prompt = threading.Event()
 
     connection_code = prompt_for_connection_code()
-    connection_code_callback = create_connection_code_callback()
+    connection_code_callback = create_connection_code_callback(stop_prompt)
     
     # Initialize and run the client
     client = LinuxCommandClient(
@@ -45,6 +93,8 @@ def main() -> None:
     except Exception as e:
         print(f"Failed to run client: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        stop_prompt.set()
 
 
 if __name__ == "__main__":
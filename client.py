@@ -1,20 +1,74 @@
 import json
+import logging
+import queue
+import random
 import threading
 import time
 import uuid
 from typing import List, Optional, Tuple, Callable
 import websocket
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from logger import get_logger
-from command_executor import execute_command
+from command_executor import execute_command, truncate_output
 from system_information import SystemInformation
 
 
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class LinuxCommandClient:
     
     CONNECTION_TIMEOUT = 0.5
     RECONNECTION_INTERVAL = 1.0
+    RECONNECTION_MAX_INTERVAL = 60.0
     REGISTRATION_TIMEOUT = 5.0 
+    SYSTEM_INFORMATION_INTERVAL = 1.0
+    
+    __slots__ = (
+        'server_url',
+        'websocket_url',
+        'device_id',
+        'connection_code',
+        'connection_code_callback',
+        '_ws',
+        '_sock',
+        '_ws_thread',
+        '_sysinfo_thread',
+        '_command_thread',
+        '_command_queue',
+        '_wake',
+        '_stop',
+        '_connected',
+        '_connecting',
+        '_shutdown_requested',
+        '_registration_failed',
+        '_registration_pending',
+        '_registration_start_time',
+        '_reconnect_backoff',
+        '_next_reconnect_time',
+        '_device_id_json',
+        '_sysinfo_prefix',
+        '_command_result_prefix',
+        '_registration_frame',
+        '_sysinfo',
+        '_static_info',
+        '_static_info_json',
+        '_logger',
+    )
     
     def __init__(
         self, 
@@ -22,7 +76,7 @@ class LinuxCommandClient:
         websocket_url: str, 
         device_id: Optional[str] = None, 
         connection_code: Optional[str] = None,
-        connection_code_callback: Optional[Callable[[], str]] = None
+        connection_code_callback: Optional[Callable[[], Optional[str]]] = None
     ):
 
         self.server_url = server_url.rstrip('/')
@@ -32,15 +86,40 @@ class LinuxCommandClient:
         self.connection_code_callback = connection_code_callback
         
         self._ws = None
+        self._sock = None
+        self._ws_thread = None
+        self._sysinfo_thread = None
+        self._command_thread = None
+        self._command_queue = queue.SimpleQueue()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
         self._connected = False
         self._connecting = False
         self._shutdown_requested = False
         self._registration_failed = False
         self._registration_pending = False
         self._registration_start_time = None
+        self._reconnect_backoff = self.RECONNECTION_INTERVAL
+        self._next_reconnect_time = 0.0
+        
+        self._device_id_json = _dumps(self.device_id)
+        self._sysinfo_prefix = (
+            b'{"type":"system_information","deviceId":'
+            + self._device_id_json
+            + b',"system_information":'
+        )
+        self._command_result_prefix = (
+            b'{"type":"command_result","deviceId":'
+            + self._device_id_json
+            + b','
+        )
+        self._registration_frame = None
+        self._sysinfo = SystemInformation()
+        self._static_info = None
+        self._static_info_json = None
         
         self._logger = get_logger("LinuxCommandClient")
-        self._logger.info(f"Initializing client with device ID: {self.device_id}")
+        self._logger.info("Initializing client with device ID: %s", self.device_id)
         
     @property
     def connected(self) -> bool:
@@ -52,7 +131,7 @@ class LinuxCommandClient:
             return
             
         self._connecting = True
-        self._logger.info(f"Connecting to {self.websocket_url}")
+        self._logger.info("Connecting to %s", self.websocket_url)
         
         try:
             self._ws = websocket.WebSocketApp(
@@ -63,8 +142,12 @@ class LinuxCommandClient:
                 on_open=self._on_open
             )
             
-            ws_thread = threading.Thread(target=self._ws.run_forever, daemon=True)
-            ws_thread.start()
+            self._ws_thread = threading.Thread(
+                target=self._ws.run_forever,
+                kwargs={"skip_utf8_validation": True},
+                daemon=True
+            )
+            self._ws_thread.start()
             
             time.sleep(self.CONNECTION_TIMEOUT)
         except Exception as e:
@@ -74,35 +157,32 @@ class LinuxCommandClient:
     
     def disconnect(self) -> None:
         self._shutdown_requested = True
+        self._wake.set()
+        self._stop.set()
+        self._command_queue.put(None)
+        self._sysinfo.close()
         if self._ws:
             self._ws.close()
     
     def run(self) -> None:
         try:
+            self._sysinfo_thread = threading.Thread(target=self._system_information_loop, daemon=True)
+            self._sysinfo_thread.start()
+            
+            self._command_thread = threading.Thread(target=self._command_loop, daemon=True)
+            self._command_thread.start()
+            
             self.connect()
             
             while not self._shutdown_requested:
-                if self._connected:
-                    self._send_system_information()
-                    if self._registration_failed and self.connection_code_callback:
-                        self._logger.info("Registration failed. Requesting new connection code...")
-                        try:
-                            self.connection_code = self.connection_code_callback()
-                            self._registration_failed = False
-                            self._logger.info("New connection code obtained. Attempting to reconnect...")
-                        except KeyboardInterrupt:
-                            self._logger.info("User cancelled connection code input")
-                            break
-                        except Exception as e:
-                            self._logger.error(f"Error getting new connection code: {e}")
-                            break
-                    
-                    if not self._registration_failed:
-                        self._logger.info("Not connected. Attempting to reconnect...")
-                        self._reconnect()
+                self._wake.wait(timeout=self.RECONNECTION_INTERVAL)
+                self._wake.clear()
+                
+                if self._shutdown_requested:
+                    break
                 
                 if self._registration_pending and self._registration_start_time:
-                    if time.time() - self._registration_start_time > self.REGISTRATION_TIMEOUT:
+                    if time.monotonic() - self._registration_start_time > self.REGISTRATION_TIMEOUT:
                         self._logger.warning("Registration timeout - treating as failed")
                         self._registration_failed = True
                         self._registration_pending = False
@@ -110,7 +190,27 @@ class LinuxCommandClient:
                         if self._ws:
                             self._ws.close()
                 
-                time.sleep(self.RECONNECTION_INTERVAL)
+                if self._connected or self._registration_pending:
+                    continue
+                
+                if self._registration_failed:
+                    if not self.connection_code_callback:
+                        continue
+                    self._logger.debug("Registration failed. Requesting new connection code...")
+                    try:
+                        connection_code = self.connection_code_callback()
+                        if connection_code is None:
+                            continue
+                        self.connection_code = connection_code
+                        self._registration_frame = None
+                        self._registration_failed = False
+                        self._next_reconnect_time = 0.0
+                        self._logger.info("New connection code obtained. Attempting to reconnect...")
+                    except Exception as e:
+                        self._logger.error(f"Error getting new connection code: {e}")
+                        break
+                
+                self._reconnect()
         
         except KeyboardInterrupt:
             self._logger.info("Shutting down client...")
@@ -120,20 +220,32 @@ class LinuxCommandClient:
             self.disconnect()
     
     def _reconnect(self) -> None:
+        if self._ws_thread and self._ws_thread.is_alive():
+            return
+        
+        now = time.monotonic()
+        if now < self._next_reconnect_time:
+            return
+        
         if not self._connecting and not self._connected and not self._shutdown_requested:
             self._logger.info("Attempting to reconnect...")
+            backoff = self._reconnect_backoff
+            self._next_reconnect_time = now + backoff + random.uniform(0, backoff / 2)
+            self._reconnect_backoff = min(backoff * 2, self.RECONNECTION_MAX_INTERVAL)
             try:
                 self.connect()
             except Exception as e:
                 self._logger.error(f"Reconnection failed: {e}")
     
-    def _on_message(self, ws, message: str) -> None:
+    def _on_message(self, ws, message: bytes) -> None:
         try:
-            data = json.loads(message)
-            self._logger.info(f"Received message: {data}")
-            
+            data = _loads(message)
             message_type = data.get('type')
             
+            self._logger.info("Received message type=%s", message_type)
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Received message: %s", data)
+            
             if message_type == 'connected':
                 self._register_device()
             elif message_type == 'registered':
@@ -150,16 +262,28 @@ class LinuxCommandClient:
     
     def _on_error(self, ws, error) -> None:
         self._logger.error(f"WebSocket error: {error}")
+        self._sock = None
         self._connected = False
         self._connecting = False
+        self._wake.set()
     
     def _on_close(self, ws, close_status_code, close_msg) -> None:
-        self._logger.info(f"WebSocket connection closed: {close_status_code} - {close_msg}")
+        self._logger.info("WebSocket connection closed: %s - %s", close_status_code, close_msg)
+        self._sock = None
         self._connected = False
         self._connecting = False
+        self._wake.set()
     
     def _on_open(self, ws) -> None:
         self._logger.info("WebSocket connection established")
+        self._sock = ws.sock
+    
+    def _send(self, payload: bytes) -> None:
+        sock = self._sock
+        if sock is None:
+            raise websocket.WebSocketConnectionClosedException("Connection is already closed.")
+        
+        sock.send_frame(websocket.ABNF.create_frame(payload, websocket.ABNF.OPCODE_TEXT))
     
     def _register_device(self) -> None:
         if not self._ws:
@@ -167,19 +291,22 @@ class LinuxCommandClient:
             return
             
         try:
-            registration_data = {
-                "type": "register",
-                "deviceId": self.device_id,
-            }
-            
-            if self.connection_code:
-                registration_data["connectionCode"] = self.connection_code
+            if self._registration_frame is None:
+                registration_data = {
+                    "type": "register",
+                    "deviceId": self.device_id,
+                }
+                
+                if self.connection_code:
+                    registration_data["connectionCode"] = self.connection_code
+                
+                self._registration_frame = _dumps(registration_data)
             
-            self._ws.send(json.dumps(registration_data))
-            self._logger.info(f"Sent registration for device ID: {self.device_id}")
+            self._send(self._registration_frame)
+            self._logger.info("Sent registration for device ID: %s", self.device_id)
             
             self._registration_pending = True
-            self._registration_start_time = time.time()
+            self._registration_start_time = time.monotonic()
             
         except Exception as e:
             self._logger.error(f"Failed to register device: {e}")
@@ -193,10 +320,16 @@ class LinuxCommandClient:
             print("Device connected successfully to LLinux!")
             self._connected = True
             self._registration_failed = False
+            self._reconnect_backoff = self.RECONNECTION_INTERVAL
+            self._next_reconnect_time = 0.0
         else:
             self._logger.error("Device registration failed!")
             self._connected = False
             self._registration_failed = True
+            if self._ws:
+                self._ws.close()
+        
+        self._wake.set()
     
     def _handle_execute_command(self, data: dict) -> None:
         command_id = data.get('commandId')
@@ -206,18 +339,29 @@ class LinuxCommandClient:
             self._logger.warning("Received empty command list")
             return
         
-        self._execute_commands(commands, command_id)
+        self._command_queue.put((commands, command_id))
+    
+    def _command_loop(self) -> None:
+        while True:
+            batch = self._command_queue.get()
+            if batch is None or self._shutdown_requested:
+                return
+            self._execute_commands(*batch)
     
     def _execute_commands(self, commands: List[str], command_id: str) -> None:
         for i, cmd in enumerate(commands):
-            self._logger.info(f"Executing command {i} (batch {command_id}): {cmd}")
+            if self._shutdown_requested:
+                self._logger.info("Shutdown requested, skipping remaining commands in batch %s", command_id)
+                return
+            
+            self._logger.info("Executing command %s (batch %s): %s", i, command_id, cmd)
             
             try:
                 output, success = execute_command(cmd)
                 self._send_command_results(command_id, i, cmd, output, success)
                 
             except Exception as e:
-                error_msg = f"Error executing command: {e}"
+                error_msg = truncate_output(f"Error executing command: {e}")
                 self._logger.error(f"Error executing command {i} (batch {command_id}): {e}")
                 self._send_command_results(command_id, i, cmd, error_msg, False)
     
@@ -235,8 +379,6 @@ class LinuxCommandClient:
             
         try:
             result_data = {
-                "type": "command_result",
-                "deviceId": self.device_id,
                 "commandId": command_id,
                 "index": index,
                 "command": command,
@@ -244,28 +386,36 @@ class LinuxCommandClient:
                 "success": success
             }
             
-            self._ws.send(json.dumps(result_data))
-            self._logger.info(f"Successfully sent results for command {index} (batch {command_id})")
+            self._send(self._command_result_prefix + _dumps(result_data)[1:])
+            self._logger.info("Successfully sent results for command %s (batch %s)", index, command_id)
             
         except Exception as e:
             self._logger.error(f"Error sending command results via WebSocket: {e}")
 
+    def _system_information_loop(self) -> None:
+        while not self._stop.wait(self.SYSTEM_INFORMATION_INTERVAL):
+            if self._connected:
+                self._send_system_information()
+
     def _send_system_information(self) -> None:
         if not self._ws or not self._connected:
             self._logger.error("Cannot send system info: WebSocket not connected")
             return
         
         try:
-            system_info = SystemInformation()
+            if self._static_info is None:
+                self._static_info = self._sysinfo.collect_all_info()
+                self._static_info_json = _dumps(self._static_info)
             
-            info_data = {
-                "type": "system_information",
-                "deviceId": self.device_id,
-                "system_information": system_info.collect_all_info(),
-                "system_resources": system_info.collect_all_resources()
-            }
+            payload = (
+                self._sysinfo_prefix
+                + self._static_info_json
+                + b',"system_resources":'
+                + _dumps(self._sysinfo.collect_all_resources())
+                + b'}'
+            )
             
-            self._ws.send(json.dumps(info_data))
+            self._send(payload)
             
         except Exception as e:
             self._logger.error(f"Error sending system information via WebSocket: {e}")
\ No newline at end of file
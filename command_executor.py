@@ -1,39 +1,133 @@
+import os
+import select
 import subprocess
-from typing import Tuple
+import time
+from typing import Optional, Tuple
 
 from logger import get_logger
 
 logger = get_logger("CommandExecutor")
 
+READ_CHUNK_SIZE = 65536
+MAX_CAPTURE_BYTES = 1024 * 1024
+
+STDERR_SEPARATOR = "\n--- stderr ---\n"
+LINES_TRUNCATED_FORMAT = "\n\n... output truncated ({} more lines) ...".format
+CHARS_TRUNCATED_FORMAT = "\n... output truncated ({} more characters) ...".format
+
 
 def execute_command(cmd: str, timeout: int = 10) -> Tuple[str, bool]:
+    process = None
     try:
         process = subprocess.Popen(
             cmd,
             shell=True,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True
+            stderr=subprocess.PIPE
         )
         
-        stdout, stderr = process.communicate(timeout=timeout)
+        stdout, stderr = read_output(process, timeout)
         success = (process.returncode == 0)
         
-        output = stdout
-        if stderr:
-            output += f"\n--- stderr ---\n{stderr}"
+        output = stdout + STDERR_SEPARATOR + stderr if stderr else stdout
         
         output = truncate_output(output)
         
         return output, success
         
     except subprocess.TimeoutExpired:
-        process.kill()
         logger.error(f"Command timed out and was killed: {cmd}")
         return "Command execution timed out and process was killed!", False
     except Exception as e:
         logger.error(f"Error executing command '{cmd}': {e}")
         return f"Error executing command: {e}", False
+    finally:
+        if process is not None:
+            _reap(process)
+
+
+def read_output(process: subprocess.Popen, timeout: float) -> Tuple[str, str]:
+    deadline = time.monotonic() + timeout
+    stdout_fd = process.stdout.fileno()
+    stderr_fd = process.stderr.fileno()
+    buffers = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+    open_fds = {stdout_fd, stderr_fd}
+    
+    poller = select.poll()
+    for fd in open_fds:
+        poller.register(fd, select.POLLIN)
+    
+    pidfd = _open_pidfd(process.pid)
+    if pidfd is not None:
+        poller.register(pidfd, select.POLLIN)
+    
+    try:
+        exited = False
+        while open_fds and not exited:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(process.args, timeout)
+            
+            for fd, _ in poller.poll(remaining * 1000):
+                if fd == pidfd:
+                    exited = True
+                    continue
+                
+                chunk = os.read(fd, READ_CHUNK_SIZE)
+                if not chunk:
+                    poller.unregister(fd)
+                    open_fds.discard(fd)
+                    continue
+                _capture(buffers[fd], chunk)
+        
+        # Background jobs may still hold the pipes open; take what is buffered and stop
+        for fd in open_fds:
+            os.set_blocking(fd, False)
+            while time.monotonic() < deadline:
+                try:
+                    chunk = os.read(fd, READ_CHUNK_SIZE)
+                except BlockingIOError:
+                    break
+                if not chunk:
+                    break
+                _capture(buffers[fd], chunk)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+    
+    process.wait(timeout=max(deadline - time.monotonic(), 0))
+    
+    return _decode_output(buffers[stdout_fd]), _decode_output(buffers[stderr_fd])
+
+
+def _reap(process: subprocess.Popen) -> None:
+    if process.poll() is None:
+        process.kill()
+        process.wait()
+    
+    process.stdout.close()
+    process.stderr.close()
+
+
+def _open_pidfd(pid: int) -> Optional[int]:
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _capture(buffer: bytearray, chunk: bytes) -> None:
+    # Keep draining past the cap so the child never blocks on a full pipe
+    if len(buffer) < MAX_CAPTURE_BYTES:
+        buffer += chunk[:MAX_CAPTURE_BYTES - len(buffer)]
+
+
+def _decode_output(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
 
 
 def truncate_output(
@@ -43,16 +137,22 @@ def truncate_output(
 ) -> str:
     if not output:
         return output
+    
+    if len(output) <= max_length and output.count("\n") < max_lines:
+        return output
         
-    lines = output.splitlines()
-    if len(lines) > max_lines:
-        lines_truncated = len(lines) - max_lines
-        truncated_lines = lines[:max_lines]
-        truncated_lines.append(f"\n... output truncated ({lines_truncated} more lines) ...")
-        output = "\n".join(truncated_lines)
+    end = -1
+    for _ in range(max_lines):
+        end = output.find("\n", end + 1)
+        if end == -1:
+            break
+    
+    if end != -1 and end + 1 < len(output):
+        lines_truncated = output.count("\n", end + 1) + (not output.endswith("\n"))
+        output = output[:end] + LINES_TRUNCATED_FORMAT(lines_truncated)
         
     if len(output) > max_length:
         chars_truncated = len(output) - max_length
-        output = output[:max_length] + f"\n... output truncated ({chars_truncated} more characters) ..."
+        output = output[:max_length] + CHARS_TRUNCATED_FORMAT(chars_truncated)
         
     return output
\ No newline at end of file
@@ -1,110 +1,110 @@
+import atexit
+import functools
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
+import queue
+import re
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOG_DIR = os.path.join(os.path.expanduser("~"), ".linux_command_client")
-os.makedirs(LOG_DIR, exist_ok=True)
 LOG_FILE = os.path.join(LOG_DIR, "client.log")
 
 _configured_loggers = set()
+_queue_handler = None
+
+PRODUCTION_MODES = ('production', 'prod')
+KNOWN_MODES = PRODUCTION_MODES + ('development', 'dev')
+
+_ENV_LINE_RE = re.compile(r'^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
 
 def _load_env_file() -> dict:
     env_vars = {}
     
-    current_dir = Path.cwd()
+    directory = os.getcwd()
     env_file = None
     
-    for path in [current_dir] + list(current_dir.parents):
-        potential_env = path / ".env"
-        if potential_env.exists():
+    while True:
+        potential_env = os.path.join(directory, ".env")
+        if os.path.isfile(potential_env):
             env_file = potential_env
             break
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
     
-    if env_file and env_file.exists():
+    if env_file:
         try:
             with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        env_vars[key.strip()] = value.strip().strip('"').strip("'")
+                data = f.read()
+            
+            env_vars = {
+                key: value.strip('"').strip("'")
+                for key, value in _ENV_LINE_RE.findall(data)
+            }
         except Exception as e:
             print(f"Warning: Could not read .env file: {e}")
     
     return env_vars
 
+@functools.lru_cache(maxsize=1)
 def _is_production_mode() -> bool:
-    env_vars = _load_env_file()
+    env_mode = os.environ.get('ENVIRONMENT', '').lower()
     
-    env_mode = (env_vars.get('ENVIRONMENT', '').lower())
+    if env_mode not in KNOWN_MODES:
+        env_vars = _load_env_file()
+        env_mode = env_vars.get('ENVIRONMENT', '').lower()
     
-    return env_mode in ['production', 'prod']
+    return env_mode in PRODUCTION_MODES
 
-class ProductionLogger:    
-    def __init__(self, name: str):
-        self.name = name
-    
-    def debug(self, *args, **kwargs):
-        pass
-    
-    def info(self, *args, **kwargs):
-        pass
-    
-    def warning(self, *args, **kwargs):
-        pass
-    
-    def warn(self, *args, **kwargs):
-        pass
-    
-    def error(self, *args, **kwargs):
-        pass
+def _get_queue_handler() -> QueueHandler:
+    global _queue_handler
     
-    def exception(self, *args, **kwargs):
-        pass
-    
-    def critical(self, *args, **kwargs):
-        pass
-    
-    def log(self, *args, **kwargs):
-        pass
-    
-    def setLevel(self, *args, **kwargs):
-        pass
-    
-    def addHandler(self, *args, **kwargs):
-        pass
-    
-    def removeHandler(self, *args, **kwargs):
-        pass
-
-def get_logger(name: str) -> logging.Logger:
-    if _is_production_mode():
-        return ProductionLogger(name)
-    
-    logger = logging.getLogger(name)
-    
-    if name not in _configured_loggers:
-        logger.setLevel(logging.INFO)
-        
+    if _queue_handler is None:
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         
+        os.makedirs(LOG_DIR, exist_ok=True)
         file_handler = RotatingFileHandler(
             LOG_FILE,
             maxBytes=10 * 1024 * 1024, 
-            backupCount=5
+            backupCount=5,
+            delay=True
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
         
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
         
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, console_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        _queue_handler = QueueHandler(log_queue)
+    
+    return _queue_handler
+
+def get_logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    
+    if name in _configured_loggers:
+        return logger
+    
+    if _is_production_mode():
+        logger.addHandler(logging.NullHandler())
         logger.propagate = False
+        logger.disabled = True
         
         _configured_loggers.add(name)
+        return logger
+    
+    logger.setLevel(logging.INFO)
+    logger.addHandler(_get_queue_handler())
+    
+    logger.propagate = False
+    
+    _configured_loggers.add(name)
     
     return logger
@@ -1,72 +1,364 @@
+import functools
 import os
 import re
+import shlex
 import subprocess
 import platform
 import shutil
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+_DISTRIB_DESCRIPTION_RE = re.compile(r'DISTRIB_DESCRIPTION="([^"]+)"')
+_EFI_BOOT_ENTRY_RE = re.compile(r'Boot([0-9a-fA-F]+)\* (.+)')
+_SYSTEMD_VERSION_RE = re.compile(r'systemd (\d+)')
+_UPSTART_VERSION_RE = re.compile(r'initctl \(upstart ([^)]+)\)')
+_CPU_MODEL_RE = re.compile(r'model name\s*:\s*(.+)')
+_LSCPU_MODEL_RE = re.compile(r'Model name:\s*(.+)')
+_GPU_CLASS_RE = re.compile(r'vga|3d|display', re.IGNORECASE)
+_GL_RENDERER_RE = re.compile(r'OpenGL renderer string:\s*(.+)')
+_BASH_VERSION_RE = re.compile(r'version\s+(.+?)[\s,]')
+_ZSH_VERSION_RE = re.compile(r'zsh\s+(\d+\.\d+[^\s]*)')
+_FISH_VERSION_RE = re.compile(r'fish,\s+version\s+(\d+\.\d+\.\d+)')
+_DPKG_VERSION_RE = re.compile(r'Version:\s+(.+)')
+_WM_NAME_RE = re.compile(r'Name:\s+(.+)')
+_X_WINDOW_ID_RE = re.compile(r'window id # (0x[0-9a-f]+)')
+_X_WM_NAME_RE = re.compile(r'= "(.*)"')
+
+_SHELL_PROBES = {
+    "bash": (["bash", "--version"], _BASH_VERSION_RE),
+    "zsh": (["zsh", "--version"], _ZSH_VERSION_RE),
+    "fish": (["fish", "--version"], _FISH_VERSION_RE),
+    "dash": (["dpkg", "-s", "dash"], _DPKG_VERSION_RE),
+}
+
+PROC_READ_SIZE = 16384
+KMSG_READ_BUDGET = 0.2
+
+PROBE_TIMEOUT = 1.0
+SLOW_PROBE_TIMEOUT = 2.0
+X11_PROBE_TIMEOUT = 5.0
+GIB = 1024 ** 3
+HUMAN_UNITS = ("B", "Ki", "Mi", "Gi", "Ti", "Pi")
+UPTIME_UNITS = (
+    ("decade", 60 * 60 * 24 * 365 * 10, None),
+    ("year", 60 * 60 * 24 * 365, 10),
+    ("week", 60 * 60 * 24 * 7, 52),
+    ("day", 60 * 60 * 24, 7),
+    ("hour", 60 * 60, 24),
+    ("minute", 60, 60),
+)
+
+
+def _read_file(path):
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _parse_os_release(text):
+    values = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#") and "=" in line:
+            key, value = line.split("=", 1)
+            try:
+                value = " ".join(shlex.split(value))
+            except ValueError:
+                value = value.strip().strip('"').strip("'")
+            values[key.strip()] = value
+    return values
+
+
+@functools.lru_cache(maxsize=64)
+def _list_dir(directory):
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _path_exists(path):
+    return os.path.exists(path)
+
+
+def _exists(path):
+    directory, name = os.path.split(path)
+    entries = _list_dir(directory) if name else None
+    if entries is not None and name not in entries:
+        return False
+    return _path_exists(path)
+
+
+def _kernel_log_contains(needle):
+    if os.geteuid() != 0 and _read_file("/proc/sys/kernel/dmesg_restrict") == "1":
+        return False
+    
+    try:
+        fd = os.open("/dev/kmsg", os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return False
+    
+    deadline = time.monotonic() + KMSG_READ_BUDGET
+    try:
+        while time.monotonic() < deadline:
+            try:
+                record = os.read(fd, 8192)
+            except BrokenPipeError:
+                continue
+            except OSError:
+                break
+            if not record:
+                break
+            if needle in record.lower():
+                return True
+    finally:
+        os.close(fd)
+    
+    return False
+
+
+def _read_proc(path, size=PROC_READ_SIZE):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return b""
+    
+    try:
+        return os.read(fd, size)
+    except OSError:
+        return b""
+    finally:
+        os.close(fd)
+
+
+def _parse_meminfo(data, keys):
+    values = {}
+    for line in data.split(b"\n"):
+        key, _, rest = line.partition(b":")
+        if key in keys:
+            values[key] = int(rest.split()[0])
+            if len(values) == len(keys):
+                break
+    return values
+
+
+def _human_bytes(size):
+    unit = 0
+    while size >= 1024 and unit < len(HUMAN_UNITS) - 1:
+        size /= 1024
+        unit += 1
+    
+    if unit and size < 10:
+        return f"{size:.1f}{HUMAN_UNITS[unit]}"
+    return f"{size:.0f}{HUMAN_UNITS[unit]}"
+
+
+def _format_uptime(seconds):
+    parts = []
+    for name, size, wrap in UPTIME_UNITS:
+        count = seconds // size
+        if wrap is not None:
+            count %= wrap
+        if count:
+            parts.append(f"{count} {name}" + ("s" if count > 1 else ""))
+    return ", ".join(parts) or "0 minutes"
+
+
+def _cached(method):
+    key = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self):
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = method(self)
+            return value
+    
+    return wrapper
+
+
+def _ttl_cached(seconds):
+    def decorator(method):
+        key = method.__name__
+        
+        @functools.wraps(method)
+        def wrapper(self):
+            now = time.monotonic()
+            entry = self._ttl_cache.get(key)
+            if entry is not None and now < entry[1]:
+                return entry[0]
+            
+            value = method(self)
+            self._ttl_cache[key] = (value, now + seconds)
+            return value
+        
+        return wrapper
+    
+    return decorator
+
+
 class CommandExecutor:    
     @staticmethod
-    def run_command(command):
+    def run_command(argv, timeout=PROBE_TIMEOUT):
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                check=False,
+            process = subprocess.Popen(
+                argv,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                timeout=5
+                start_new_session=True
             )
-            return result.stdout.strip()
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
+        except (subprocess.SubprocessError, OSError):
+            return ""
+        
+        try:
+            stdout, _ = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            process.wait()
+            process.stdout.close()
             return ""
         
+        return stdout.strip()
+        
 
 class SystemInformation:
     
+    COLLECTION_WORKERS = 8
+    CPU_SAMPLE_INTERVAL = 0.1
+    
     def __init__(self):
         self.executor = CommandExecutor()
+        self._cache = {}
+        self._ttl_cache = {}
+        self._prev_cpu = None
+        self._proc_fds = {}
+        self._pool = None
+        self._closed = False
+        self._lock = threading.Lock()
+    
+    def close(self):
+        with self._lock:
+            self._closed = True
+            for fd in self._proc_fds.values():
+                os.close(fd)
+            self._proc_fds.clear()
+            pool, self._pool = self._pool, None
+        
+        if pool is not None:
+            pool.shutdown(wait=False)
+    
+    def invalidate(self):
+        self._cache.clear()
+        self._ttl_cache.clear()
+        _list_dir.cache_clear()
+        _path_exists.cache_clear()
+        self.__dict__.pop('_path_binaries', None)
+    
+    @functools.cached_property
+    def _path_binaries(self):
+        binaries = set()
+        for directory in os.environ.get("PATH", "").split(os.pathsep):
+            try:
+                with os.scandir(directory or ".") as entries:
+                    for entry in entries:
+                        if entry.is_file() and os.access(entry.path, os.X_OK):
+                            binaries.add(entry.name)
+            except OSError:
+                pass
+        return binaries
+    
+    
+    @_ttl_cached(1)
+    def _running_comms(self):
+        comms = set()
+        for pid in os.listdir("/proc"):
+            if pid.isdigit():
+                comm = _read_file(f"/proc/{pid}/comm")
+                if comm:
+                    comms.add(comm.lower())
+        return frozenset(comms)
+    
+    @_ttl_cached(1)
+    def _running_cmdlines(self):
+        cmdlines = []
+        for pid in os.listdir("/proc"):
+            if pid.isdigit():
+                cmdline = _read_file(f"/proc/{pid}/cmdline")
+                if cmdline:
+                    cmdlines.append(cmdline.replace("\0", " "))
+        return tuple(cmdlines)
+    
+    @_cached
+    def _mem_total_kb(self):
+        return _parse_meminfo(self._pread_proc("/proc/meminfo"), (b"MemTotal",)).get(b"MemTotal")
+    
+    def _pread_proc(self, path):
+        with self._lock:
+            if self._closed:
+                return _read_proc(path)
+            
+            fd = self._proc_fds.get(path)
+            if fd is None:
+                try:
+                    fd = self._proc_fds[path] = os.open(path, os.O_RDONLY)
+                except OSError:
+                    return b""
+            
+            try:
+                return os.pread(fd, PROC_READ_SIZE, 0)
+            except OSError:
+                return b""
+    
+    def _is_running(self, name):
+        return any(name in comm for comm in self._running_comms())
 
+    @_cached
     def get_distribution(self):
 
-        if os.path.exists("/etc/os-release"):
-            os_release = self.executor.run_command("cat /etc/os-release")
-            
-            pretty_name_match = re.search(r'PRETTY_NAME="([^"]+)"', os_release)
-            if pretty_name_match:
-                return pretty_name_match.group(1)
-            
-            name_match = re.search(r'NAME="([^"]+)"', os_release)
-            version_match = re.search(r'VERSION="([^"]+)"', os_release)
-            
-            if name_match:
-                name = name_match.group(1)
-                version = version_match.group(1) if version_match else ""
-                return f"{name} {version}".strip()
-        
-        if os.path.exists("/etc/lsb-release"):
-            lsb_release = self.executor.run_command("cat /etc/lsb-release")
-            distro_match = re.search(r'DISTRIB_DESCRIPTION="([^"]+)"', lsb_release)
+        os_release = _parse_os_release(
+            _read_file("/etc/os-release") or _read_file("/usr/lib/os-release")
+        )
+        if os_release.get("PRETTY_NAME"):
+            return os_release["PRETTY_NAME"]
+        
+        if os_release.get("NAME"):
+            return f"{os_release['NAME']} {os_release.get('VERSION', '')}".strip()
+        
+        lsb_release = _read_file("/etc/lsb-release")
+        if lsb_release:
+            distro_match = _DISTRIB_DESCRIPTION_RE.search(lsb_release)
             if distro_match:
                 return distro_match.group(1)
         
         for file_path in ["/etc/redhat-release", "/etc/debian_version", "/etc/SuSE-release", "/etc/arch-release"]:
-            if os.path.exists(file_path):
-                content = self.executor.run_command(f"cat {file_path}")
-                if content:
-                    if file_path == "/etc/debian_version":
-                        return f"Debian {content}"
-                    if file_path == "/etc/arch-release":
-                        return "Arch Linux"
-                    return content
-        
-        lsb_release_path = shutil.which("lsb_release")
-        if lsb_release_path:
-            return self.executor.run_command("lsb_release -ds")
-        
-        return platform.linux_distribution()[0] if hasattr(platform, 'linux_distribution') else "Unknown Linux Distribution"
+            content = _read_file(file_path)
+            if content:
+                if file_path == "/etc/debian_version":
+                    return f"Debian {content}"
+                if file_path == "/etc/arch-release":
+                    return "Arch Linux"
+                return content
+        
+        if "lsb_release" in self._path_binaries:
+            description = self.executor.run_command(["lsb_release", "-ds"]).strip('"')
+            if description:
+                return description
+        
+        return "Unknown Linux Distribution"
     
+    @_cached
     def get_package_manager(self):
         package_managers = []
         
@@ -84,117 +376,133 @@ class SystemInformation:
             "snap": "Snap",
         }
         
+        found = set()
         for cmd, name in package_manager_cmds.items():
-            if shutil.which(cmd):
+            if cmd in self._path_binaries:
                 package_managers.append(name)
+                found.add(cmd)
         
-        if shutil.which("rpm"):
-            if "DNF" not in " ".join(package_managers) and "YUM" not in " ".join(package_managers):
+        if "rpm" in self._path_binaries:
+            if "dnf" not in found and "yum" not in found:
                 package_managers.append("RPM")
         
-        if shutil.which("dpkg"):
-            if "APT" not in " ".join(package_managers):
+        if "dpkg" in self._path_binaries:
+            if "apt" not in found and "apt-get" not in found:
                 package_managers.append("DPKG (Debian-based)")
         
-        if shutil.which("nix") or os.path.exists("/nix"):
+        if "nix" in self._path_binaries or _exists("/nix"):
             package_managers.append("Nix")
         
         return ", ".join(package_managers) if package_managers else "Unknown Package Manager"
     
+    @_cached
     def get_bootloader(self):
-        if os.path.exists("/boot/grub") or os.path.exists("/boot/grub2"):
-            grub_version = self.executor.run_command("grub-install --version 2>/dev/null || grub2-install --version 2>/dev/null")
+        if _exists("/boot/grub") or _exists("/boot/grub2"):
+            grub_version = (
+                self.executor.run_command(["grub-install", "--version"])
+                or self.executor.run_command(["grub2-install", "--version"])
+            )
             if grub_version:
                 return f"GRUB ({grub_version.split()[-1]})"
             return "GRUB"
         
-        if os.path.exists("/boot/efi/EFI/systemd") or os.path.exists("/boot/efi/EFI/BOOT/systemd-bootx64.efi"):
+        if _exists("/boot/efi/EFI/systemd") or _exists("/boot/efi/EFI/BOOT/systemd-bootx64.efi"):
             return "systemd-boot"
         
-        if os.path.exists("/etc/lilo.conf"):
+        if _exists("/etc/lilo.conf"):
             return "LILO"
         
-        if os.path.exists("/sys/firmware/efi"):
-            efi_entries = self.executor.run_command("efibootmgr -v 2>/dev/null")
+        if _exists("/sys/firmware/efi"):
+            efi_entries = self.executor.run_command(["efibootmgr", "-v"])
             if "rEFInd" in efi_entries:
                 return "rEFInd"
             if efi_entries:
-                boot_entry_match = re.search(r'Boot([0-9a-fA-F]+)\* (.+)', efi_entries)
+                boot_entry_match = _EFI_BOOT_ENTRY_RE.search(efi_entries)
                 if boot_entry_match:
                     return f"UEFI ({boot_entry_match.group(2)})"
                 return "UEFI"
         
-        if os.path.exists("/proc/xen"):
+        if _exists("/proc/xen"):
             return "Xen Hypervisor"
         
-        dmesg_output = self.executor.run_command("dmesg | grep -i boot")
-        if "syslinux" in dmesg_output.lower():
+        if _kernel_log_contains(b"syslinux"):
             return "Syslinux"
         
-        return "Unknown Package Manager"
+        return "Unknown Bootloader"
     
+    @_cached
     def get_init_system(self):
-        if os.path.exists("/run/systemd/system") or os.path.exists("/sys/fs/cgroup/systemd"):
-            systemd_version = self.executor.run_command("systemctl --version")
+        if _exists("/run/systemd/system") or _exists("/sys/fs/cgroup/systemd"):
+            systemd_version = self.executor.run_command(["systemctl", "--version"])
             if systemd_version:
-                version_match = re.search(r'systemd (\d+)', systemd_version)
+                version_match = _SYSTEMD_VERSION_RE.search(systemd_version)
                 if version_match:
                     return f"systemd (version {version_match.group(1)})"
             return "systemd"
         
-        if os.path.exists("/etc/init.d") and os.path.exists("/etc/inittab"):
+        if _exists("/etc/init.d") and _exists("/etc/inittab"):
             return "SysVinit"
         
-        if os.path.exists("/etc/init"):
-            upstart_version = self.executor.run_command("initctl --version 2>/dev/null")
+        if _exists("/etc/init"):
+            upstart_version = self.executor.run_command(["initctl", "--version"])
             if "upstart" in upstart_version.lower():
-                version_match = re.search(r'initctl \(upstart ([^)]+)\)', upstart_version)
+                version_match = _UPSTART_VERSION_RE.search(upstart_version)
                 if version_match:
                     return f"Upstart (version {version_match.group(1)})"
                 return "Upstart"
         
-        if os.path.exists("/etc/init.d") and os.path.exists("/etc/rc.conf"):
-            openrc_version = self.executor.run_command("rc-status --version 2>/dev/null")
+        if _exists("/etc/init.d") and _exists("/etc/rc.conf"):
+            openrc_version = self.executor.run_command(["rc-status", "--version"])
             if openrc_version:
                 return f"OpenRC ({openrc_version.split()[-1]})"
             return "OpenRC"
         
-        if os.path.exists("/etc/runit") or os.path.exists("/etc/sv"):
+        if _exists("/etc/runit") or _exists("/etc/sv"):
             return "runit"
         
-        if os.path.exists("/etc/s6") or self.executor.run_command("s6-svscan --help 2>/dev/null"):
+        if _exists("/etc/s6") or self.executor.run_command(["s6-svscan", "--help"]):
             return "s6"
         
-        pid1_cmd = self.executor.run_command("cat /proc/1/comm")
+        pid1_cmd = _read_file("/proc/1/comm")
         if pid1_cmd:
             return f"PID 1: {pid1_cmd}"
         
         return "Unknown Init System"
     
+    @_cached
     def get_kernel_version(self):
         return platform.release()
     
+    @_cached
     def get_cpu_info(self):
-        cpu_info = self.executor.run_command("cat /proc/cpuinfo | grep 'model name' | head -n1")
-        if cpu_info:
-            model_match = re.search(r'model name\s*:\s*(.+)', cpu_info)
-            if model_match:
-                return model_match.group(1)
-        
-        lscpu_output = self.executor.run_command("lscpu | grep 'Model name'")
+        try:
+            with open("/proc/cpuinfo", 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    if line.startswith("model name"):
+                        model_match = _CPU_MODEL_RE.match(line)
+                        if model_match:
+                            return model_match.group(1)
+                        break
+        except OSError:
+            pass
+        
+        lscpu_output = self.executor.run_command(["lscpu"])
         if lscpu_output:
-            model_match = re.search(r'Model name:\s*(.+)', lscpu_output)
+            model_match = _LSCPU_MODEL_RE.search(lscpu_output)
             if model_match:
                 return model_match.group(1)
         
         arch = platform.machine()
         return f"Unknown CPU ({arch})"
     
+    @_cached
     def get_gpu_info(self):
-        lspci_output = self.executor.run_command("lspci | grep -i 'vga\\|3d\\|display'")
+        lspci_output = self.executor.run_command(["lspci"], timeout=SLOW_PROBE_TIMEOUT)
         if lspci_output:
             gpu_lines = []
             for line in lspci_output.split('\n'):
+                if not _GPU_CLASS_RE.search(line):
+                    continue
                 if any(vendor in line.lower() for vendor in ['nvidia', 'amd', 'ati', 'intel', 'matrox', 'asmedia', 'via', 'silicon']):
                     parts = line.split(':', 1)
                     if len(parts) > 1:
@@ -205,36 +513,37 @@ class SystemInformation:
             if gpu_lines:
                 return ", ".join(gpu_lines)
         
-        if os.path.exists("/sys/class/drm"):
-            gpu_nodes = self.executor.run_command("find /sys/class/drm -name 'card*' | sort")
-            if gpu_nodes:
-                return f"GPU devices found: {gpu_nodes.count('card')}"
+        try:
+            gpu_count = sum(
+                1 for entry in os.listdir("/sys/class/drm")
+                if entry.startswith("card") and entry[4:].isdigit()
+            )
+        except OSError:
+            gpu_count = 0
+        if gpu_count:
+            return f"GPU devices found: {gpu_count}"
         
-        glxinfo_output = self.executor.run_command("glxinfo 2>/dev/null | grep 'OpenGL renderer'")
+        glxinfo_output = self.executor.run_command(["glxinfo"], timeout=X11_PROBE_TIMEOUT)
         if glxinfo_output:
-            renderer_match = re.search(r'OpenGL renderer string:\s*(.+)', glxinfo_output)
+            renderer_match = _GL_RENDERER_RE.search(glxinfo_output)
             if renderer_match:
                 return renderer_match.group(1)
         
         return "Unknown GPU"
         
     def get_memory_info(self):
-        meminfo = self.executor.run_command("cat /proc/meminfo")
-        
         ram_total = "Unknown"
         swap_total = "Unknown"
         
-        ram_match = re.search(r'MemTotal:\s+(\d+)\s+kB', meminfo)
-        if ram_match:
-            ram_kb = int(ram_match.group(1))
+        ram_kb = self._mem_total_kb()
+        if ram_kb is not None:
             if ram_kb > 1048576:
                 ram_total = f"{ram_kb / 1048576:.2f} GB"
             else:
                 ram_total = f"{ram_kb / 1024:.2f} MB"
         
-        swap_match = re.search(r'SwapTotal:\s+(\d+)\s+kB', meminfo)
-        if swap_match:
-            swap_kb = int(swap_match.group(1))
+        swap_kb = _parse_meminfo(self._pread_proc("/proc/meminfo"), (b"SwapTotal",)).get(b"SwapTotal")
+        if swap_kb is not None:
             if swap_kb > 1048576:
                 swap_total = f"{swap_kb / 1048576:.2f} GB"
             elif swap_kb > 0:
@@ -245,59 +554,46 @@ class SystemInformation:
         return f"RAM: {ram_total}, Swap: {swap_total}"
     
     def detect_docker(self):
-        if os.path.exists("/.dockerenv"):
+        if _exists("/.dockerenv"):
             return "Running inside Docker container (found /.dockerenv)"
         
-        cgroup_content = self.executor.run_command("cat /proc/1/cgroup 2>/dev/null")
-        if cgroup_content and ("docker" in cgroup_content or "containerd" in cgroup_content):
+        cgroup_content = _read_proc("/proc/1/cgroup")
+        if b"docker" in cgroup_content or b"containerd" in cgroup_content:
             return "Running inside Docker container (detected in cgroups)"
         
-        proc_1_cmdline = self.executor.run_command("cat /proc/1/cmdline 2>/dev/null")
-        if proc_1_cmdline and "containerd" in proc_1_cmdline:
+        proc_1_cmdline = _read_proc("/proc/1/cmdline")
+        if b"containerd" in proc_1_cmdline:
             return "Running inside container (containerd detected)"
         
-        if shutil.which("docker"):
-            docker_version = self.executor.run_command("docker --version 2>/dev/null")
+        if "docker" in self._path_binaries:
+            docker_version = self.executor.run_command(["docker", "--version"])
             if docker_version:
                 return f"Docker installed: {docker_version}"
             return "Docker installed"
         
         return "Docker not detected"
     
+    @_cached
     def get_shell_info(self):
         current_shell = os.environ.get("SHELL", "")
-        shell_name = os.path.basename(current_shell) if current_shell else "Unknown"
+        if not current_shell:
+            return "Unknown"
         
-        version = ""
-        if shell_name == "bash":
-            version = self.executor.run_command("bash --version | head -n1")
-            if version:
-                version_match = re.search(r'version\s+(.+?)[\s,]', version)
-                if version_match:
-                    version = version_match.group(1)
-        elif shell_name == "zsh":
-            version = self.executor.run_command("zsh --version")
-            if version:
-                version_match = re.search(r'zsh\s+(\d+\.\d+[^\s]*)', version)
-                if version_match:
-                    version = version_match.group(1)
-        elif shell_name == "fish":
-            version = self.executor.run_command("fish --version")
-            if version:
-                version_match = re.search(r'fish,\s+version\s+(\d+\.\d+\.\d+)', version)
-                if version_match:
-                    version = version_match.group(1)
-        elif shell_name == "dash":
-            version = self.executor.run_command("dpkg -s dash 2>/dev/null | grep Version")
-            if version:
-                version_match = re.search(r'Version:\s+(.+)', version)
-                if version_match:
-                    version = version_match.group(1)
+        shell_name = os.path.basename(current_shell)
+        probe = _SHELL_PROBES.get(shell_name)
+        if probe is None or probe[0][0] not in self._path_binaries:
+            return shell_name
+        
+        argv, version_re = probe
+        output = self.executor.run_command(argv)
+        version_match = version_re.search(output)
+        version = version_match.group(1) if version_match else output.partition("\n")[0]
         
         if version:
             return f"{shell_name} (version {version})"
         return shell_name
     
+    @_cached
     def get_display_manager(self):
         dm_services = {
             "gdm": "GDM (GNOME Display Manager)",
@@ -310,36 +606,35 @@ class SystemInformation:
             "wdm": "WDM (WINGs Display Manager)",
         }
         
-        if shutil.which("systemctl"):
-            for dm, dm_name in dm_services.items():
-                status = self.executor.run_command(f"systemctl is-active {dm}.service 2>/dev/null")
-                if status == "active":
+        if "systemctl" in self._path_binaries:
+            units = [f"{dm}.service" for dm in dm_services]
+            states = self.executor.run_command(["systemctl", "is-active", *units], timeout=SLOW_PROBE_TIMEOUT)
+            for dm_name, state in zip(dm_services.values(), states.splitlines()):
+                if state == "active":
                     return dm_name
         
         for dm, dm_name in dm_services.items():
-            if os.path.exists(f"/etc/{dm}") or os.path.exists(f"/etc/{dm}.conf"):
+            if _exists(f"/etc/{dm}") or _exists(f"/etc/{dm}.conf"):
                 return dm_name
         
-        ps_output = self.executor.run_command("ps -e | grep -E 'gdm|lightdm|sddm|xdm|lxdm|slim|wdm'")
-        if ps_output:
-            for dm, dm_name in dm_services.items():
-                if dm in ps_output:
-                    return dm_name
-        
-        if os.path.exists("/etc/X11/default-display-manager"):
-            dm_path = self.executor.run_command("cat /etc/X11/default-display-manager")
-            if dm_path:
-                dm_name = os.path.basename(dm_path)
-                for dm, full_name in dm_services.items():
-                    if dm == dm_name:
-                        return full_name
+        for dm, dm_name in dm_services.items():
+            if self._is_running(dm):
                 return dm_name
         
+        dm_path = _read_file("/etc/X11/default-display-manager")
+        if dm_path:
+            dm_name = os.path.basename(dm_path)
+            for dm, full_name in dm_services.items():
+                if dm == dm_name:
+                    return full_name
+            return dm_name
+        
         if "DISPLAY" not in os.environ and "WAYLAND_DISPLAY" not in os.environ:
             return "None (TTY console login)"
         
         return "Unknown Display Manager"
     
+    @_cached
     def get_desktop_environment(self):
         desktop_env = os.environ.get("XDG_CURRENT_DESKTOP", "")
         if desktop_env:
@@ -373,9 +668,8 @@ class SystemInformation:
             "hyprland": "Hyprland",
         }
         
-        ps_output = self.executor.run_command("ps -e").lower()
         for process, de_name in de_processes.items():
-            if process in ps_output:
+            if self._is_running(process):
                 return de_name
         
         session_manager = os.environ.get("SESSION_MANAGER", "")
@@ -389,10 +683,10 @@ class SystemInformation:
             return os.path.basename(window_manager)
         
         if "DISPLAY" in os.environ or "WAYLAND_DISPLAY" in os.environ:
-            if shutil.which("wmctrl"):
-                wm_name = self.executor.run_command("wmctrl -m 2>/dev/null | grep 'Name:'")
+            if "wmctrl" in self._path_binaries:
+                wm_name = self.executor.run_command(["wmctrl", "-m"], timeout=X11_PROBE_TIMEOUT)
                 if wm_name:
-                    name_match = re.search(r'Name:\s+(.+)', wm_name)
+                    name_match = _WM_NAME_RE.search(wm_name)
                     if name_match:
                         return f"Window Manager: {name_match.group(1)}"
         
@@ -401,34 +695,37 @@ class SystemInformation:
         
         return "Unknown Desktop Environment"
     
+    @_cached
     def get_display_server(self):
         if "WAYLAND_DISPLAY" in os.environ:
             compositor = "Unknown Wayland compositor"
             
-            if shutil.which("sway"):
-                if "sway" in self.executor.run_command("ps -e"):
+            if "sway" in self._path_binaries:
+                if self._is_running("sway"):
                     return "Wayland (Sway compositor)"
             
-            if "GNOME" in self.get_desktop_environment():
+            desktop_env = self.get_desktop_environment()
+            
+            if "GNOME" in desktop_env:
                 return "Wayland (Mutter/GNOME Shell compositor)"
             
-            if "KDE" in self.get_desktop_environment() or "Plasma" in self.get_desktop_environment():
+            if "KDE" in desktop_env or "Plasma" in desktop_env:
                 return "Wayland (KWin/KDE Plasma compositor)"
             
-            if "wlroots" in self.executor.run_command("ps -e aux | grep -i wayland"):
+            if any("wlroots" in cmdline and "wayland" in cmdline.lower() for cmdline in self._running_cmdlines()):
                 return "Wayland (wlroots-based compositor)"
             
             return "Wayland"
         
         if "DISPLAY" in os.environ:
-            if shutil.which("xprop"):
-                compositor_check = self.executor.run_command("xprop -root _NET_SUPPORTING_WM_CHECK")
+            if "xprop" in self._path_binaries:
+                compositor_check = self.executor.run_command(["xprop", "-root", "_NET_SUPPORTING_WM_CHECK"], timeout=X11_PROBE_TIMEOUT)
                 if compositor_check:
-                    window_id = re.search(r'window id # (0x[0-9a-f]+)', compositor_check)
+                    window_id = _X_WINDOW_ID_RE.search(compositor_check)
                     if window_id:
-                        wm_name = self.executor.run_command(f"xprop -id {window_id.group(1)} _NET_WM_NAME")
+                        wm_name = self.executor.run_command(["xprop", "-id", window_id.group(1), "_NET_WM_NAME"], timeout=X11_PROBE_TIMEOUT)
                         if wm_name:
-                            name_match = re.search(r'= "(.*)"', wm_name)
+                            name_match = _X_WM_NAME_RE.search(wm_name)
                             if name_match:
                                 return f"X11 (compositor: {name_match.group(1)})"
             
@@ -449,9 +746,8 @@ class SystemInformation:
                 "dwm": "dwm",
             }
             
-            ps_output = self.executor.run_command("ps -e")
             for process, compositor_name in x11_compositors.items():
-                if process in ps_output:
+                if self._is_running(process):
                     return f"X11 (compositor: {compositor_name})"
             
             return "X11 (unknown compositor)"
@@ -459,74 +755,105 @@ class SystemInformation:
         return "No display server detected (console mode)"
     
 
+    @_ttl_cached(30)
     def get_uptime(self):
-        raw = self.executor.run_command("uptime -p")
-        return raw.replace("up ", "").strip()
+        uptime = self._pread_proc("/proc/uptime").split()
+        if not uptime:
+            return "Unknown"
+        return _format_uptime(int(float(uptime[0])))
 
+    @_ttl_cached(1)
     def get_cpu_load(self):
         try:
-            return self.executor.run_command("echo $[100-$(vmstat 1 2|tail -1|awk '{print $15}')]")
+            prev = self._prev_cpu
+            if prev is None:
+                prev = self._read_cpu_times()
+                time.sleep(self.CPU_SAMPLE_INTERVAL)
+            
+            current = self._read_cpu_times()
+            self._prev_cpu = current
+            
+            idle_delta = current[0] - prev[0]
+            total_delta = current[1] - prev[1]
+            if total_delta <= 0:
+                return "0"
+            return f"{100 * (1 - idle_delta / total_delta):.0f}"
             
         except Exception:
             return "Unknown"
+    
+    def _read_cpu_times(self):
+        fields = self._pread_proc("/proc/stat").split(b"\n", 1)[0].split()[1:9]
+        
+        times = [int(value) for value in fields]
+        return times[3], sum(times)
 
 
+    @_ttl_cached(1)
     def get_memory_load(self):
-        raw = self.executor.run_command("free -h")
-        lines = raw.splitlines()
-        mem_line = next((line for line in lines if line.lower().startswith("mem")), None)
-        if mem_line:
-            parts = mem_line.split()
-            used = parts[2]
-            total = parts[1]
-            return f"{used}/{total}"
+        total_kb = self._mem_total_kb()
+        available_kb = _parse_meminfo(self._pread_proc("/proc/meminfo"), (b"MemAvailable",)).get(b"MemAvailable")
+        if total_kb is not None and available_kb is not None:
+            total = total_kb * 1024
+            used = total - available_kb * 1024
+            return f"{_human_bytes(used)}/{_human_bytes(total)}"
         return "Unknown"
 
+    @_ttl_cached(5)
     def get_disk_load(self):
-        raw = self.executor.run_command("df -BG / | grep /")
-        parts = raw.split()
-        if len(parts) >= 3:
-            used = parts[2]
-            total = parts[1]
-            return f"{used}/{total}"
-        return "Unknown"
+        try:
+            usage = shutil.disk_usage("/")
+        except OSError:
+            return "Unknown"
+        
+        return f"{-(-usage.used // GIB)}G/{-(-usage.total // GIB)}G"
 
+    @_ttl_cached(3600)
     def get_hostname(self):
-        hostname = self.executor.run_command("cat /proc/sys/kernel/hostname")
-        if hostname:
-            return hostname.strip()
-
-        hostname = self.executor.run_command("cat /etc/hostname")
-        if hostname:
-            return hostname.strip()
-
-        hostname = self.executor.run_command("uname -n")
-        return hostname.strip() if hostname else "Unknown"
+        return socket.gethostname() or "Unknown"
 
     
     def collect_all_info(self):
-        return {
-            "hostname": self.get_hostname(),
-            "linux_distribution": self.get_distribution(),
-            "package_manager": self.get_package_manager(),
-            "bootloader": self.get_bootloader(),
-            "init_system": self.get_init_system(),
-            "kernel_version": self.get_kernel_version(),
-            "cpu": self.get_cpu_info(),
-            "gpu": self.get_gpu_info(), 
-            "memory": self.get_memory_info(),
-            "is_docker_installed": self.detect_docker(),
-            "shell": self.get_shell_info(),
-            "display_manager": self.get_display_manager(),
-            "desktop_environment": self.get_desktop_environment(),
-            "display_server": self.get_display_server()
+        getters = {
+            "hostname": self.get_hostname,
+            "linux_distribution": self.get_distribution,
+            "package_manager": self.get_package_manager,
+            "bootloader": self.get_bootloader,
+            "init_system": self.get_init_system,
+            "kernel_version": self.get_kernel_version,
+            "cpu": self.get_cpu_info,
+            "gpu": self.get_gpu_info, 
+            "memory": self.get_memory_info,
+            "is_docker_installed": self.detect_docker,
+            "shell": self.get_shell_info,
+            "display_manager": self.get_display_manager,
+            "desktop_environment": self.get_desktop_environment,
+            "display_server": self.get_display_server
         }
+        
+        return self._collect(getters)
 
     def collect_all_resources(self):
-        return {
-            "hostname": self.get_hostname(),
-            "uptime": self.get_uptime(),
-            "cpu": self.get_cpu_load(),
-            "memory": self.get_memory_load(),
-            "disk": self.get_disk_load()
-        }
+        return self._collect({
+            "hostname": self.get_hostname,
+            "uptime": self.get_uptime,
+            "cpu": self.get_cpu_load,
+            "memory": self.get_memory_load,
+            "disk": self.get_disk_load
+        })
+    
+    def _collect(self, getters):
+        with self._lock:
+            if self._pool is None and not self._closed:
+                self._pool = ThreadPoolExecutor(max_workers=self.COLLECTION_WORKERS, thread_name_prefix="sysinfo")
+            pool = self._pool
+        
+        if pool is not None:
+            try:
+                futures = {key: pool.submit(getter) for key, getter in getters.items()}
+            except RuntimeError:
+                pass
+            else:
+                return {key: future.result() for key, future in futures.items()}
+        
+        return {key: getter() for key, getter in getters.items()}